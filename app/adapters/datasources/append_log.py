@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.adapters.datasources.json_store import JsonCorruptedError, JsonStoreError
+
+
+@dataclass
+class AppendLog:
+    """
+    Append-only JSONL log (one JSON object per line).
+
+    Appends are O(1) in file size: the record is written with O_APPEND
+    semantics and fsync'd, so durability matches the atomic-rename path of
+    JsonStore without rewriting the whole data file. Callers are expected
+    to serialize access with the owning store's lock.
+    """
+
+    path: Path
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a single record and fsync it to disk."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        try:
+            with open(self.path, "ab") as f:
+                f.write(line.encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            raise JsonStoreError(f"Failed appending to log: {self.path}") from e
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """Return every record in the log, oldest first."""
+        if not self.path.exists():
+            return []
+        try:
+            raw = self.path.read_bytes()
+        except OSError as e:
+            raise JsonStoreError(f"Failed reading log: {self.path}") from e
+        records: List[Dict[str, Any]] = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise JsonCorruptedError(f"Corrupted log line in {self.path}") from e
+        return records
+
+    def clear(self) -> None:
+        """Remove the log after its records have been compacted."""
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            raise JsonStoreError(f"Failed clearing log: {self.path}") from e
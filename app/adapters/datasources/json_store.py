@@ -3,12 +3,17 @@ from __future__ import annotations
 import json
 import os
 import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
 from tempfile import NamedTemporaryFile
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock
-from typing import Any, Iterator, Dict, Optional
+from typing import Any, Callable, Iterator, Dict, Optional
 
 
 class JsonStoreError(RuntimeError):
@@ -24,15 +29,20 @@ class JsonStore:
     """
     JSON file store with:
       - atomic writes (temp file + os.replace)
-      - best-effort cross-process lock using lock-file (NO fcntl)
+      - cross-process lock via fcntl.flock on a persistent lock file
+        (falls back to an O_EXCL poll loop where fcntl is unavailable)
       - in-process safety via threading.Lock
     """
 
     path: Path
     lock_timeout_s: float = 2.0
     lock_poll_interval_s: float = 0.05
+    # Optional schema-specialized serializer; defaults to generic json.dumps.
+    serializer: Optional[Callable[[Dict[str, Any]], str]] = None
 
     _mutex: Lock = field(default_factory=Lock, repr=False, compare=False)
+    _snapshot_mutex: Lock = field(default_factory=Lock, repr=False, compare=False)
+    _raw_snapshot: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -46,7 +56,9 @@ class JsonStore:
             if not self.path.exists():
                 return {}
             try:
-                raw = self.path.read_text(encoding='utf-8')
+                # Read raw bytes and let json.loads handle UTF-8 directly;
+                # this skips materializing an intermediate decoded str.
+                raw = self.path.read_bytes()
                 if not raw.strip():
                     return {}
                 data = json.loads(raw)
@@ -60,6 +72,34 @@ class JsonStore:
             except OSError as e:
                 raise JsonStoreError(f"Failed to read JSON file: {self.path}") from e
     
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Cached parsed view of the file, keyed by (st_mtime_ns, st_size).
+
+        The file is re-read and re-parsed only when it changes on disk, so
+        multiple consumers of the same store share a single parse. The
+        returned dict is shared - callers must treat it as read-only.
+        """
+        try:
+            st = os.stat(self.path)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = (-1, -1)
+
+        with self._snapshot_mutex:
+            cached = self._raw_snapshot
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+        data = self.read()
+        with self._snapshot_mutex:
+            self._raw_snapshot = (key, data)
+        return data
+
+    def _invalidate_snapshot(self) -> None:
+        with self._snapshot_mutex:
+            self._raw_snapshot = None
+
     def write(self, data: Dict[str, Any]) -> None:
         """
         Atomically writes JSON to disk:
@@ -67,8 +107,8 @@ class JsonStore:
           - fsync temp
           - os.replace(temp, target)
         """
-        payload = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True)
-        
+        payload = self._serialize(data)
+
         with self._mutex, self._lock_file():
             try:
                 tmp_dir = str(self.path.parent)
@@ -88,6 +128,7 @@ class JsonStore:
                 os.replace(str(tmp_path), str(self.path))
 
                 self._fsync_dir(self.path.parent)
+                self._invalidate_snapshot()
 
             except OSError as e:
                 raise JsonStoreError(f"Failed to write JSON file: {self.path}") from e
@@ -112,13 +153,22 @@ class JsonStore:
             self.write_unlocked(updated)
             return updated
     
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Hold the store's in-process and cross-process locks.
+        Use the *_unlocked helpers inside the with-block.
+        """
+        with self._mutex, self._lock_file():
+            yield
+
     # --------- unlocked helpers ---------
 
     def read_unlocked(self) -> Dict[str, Any]:
         if not self.path.exists():
             return {}
         try:
-            raw = self.path.read_text(encoding="utf-8")
+            raw = self.path.read_bytes()
             if not raw.strip():
                 return {}
             data = json.loads(raw)
@@ -129,7 +179,7 @@ class JsonStore:
             raise JsonStoreError(f"Failed reading {self.path}") from e
 
     def write_unlocked(self, data: Dict[str, Any]) -> None:
-        payload = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True)
+        payload = self._serialize(data)
         tmp_dir = str(self.path.parent)
         tmp_path: Optional[Path] = None
         try:
@@ -147,6 +197,7 @@ class JsonStore:
                 os.fsync(tmp.fileno())
             os.replace(str(tmp_path), str(self.path))
             self._fsync_dir(self.path.parent)
+            self._invalidate_snapshot()
         except OSError as e:
             raise JsonStoreError(f"Failed writing {self.path}") from e
         finally:
@@ -156,6 +207,11 @@ class JsonStore:
             except OSError:
                 pass
 
+    def _serialize(self, data: Dict[str, Any]) -> str:
+        if self.serializer is not None:
+            return self.serializer(data)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
     # --------- lock implementation ---------
     @property
     def _lock_path(self) -> Path:
@@ -163,6 +219,37 @@ class JsonStore:
     
     @contextmanager
     def _lock_file(self) -> Iterator[None]:
+        if fcntl is None:
+            with self._lock_file_polling():
+                yield
+            return
+
+        # The lock file is persistent and never unlinked: the kernel releases
+        # the flock when the fd closes (including on process death), so there
+        # are no stale locks and no unlink/O_EXCL races.
+        fd = os.open(str(self._lock_path), os.O_CREAT | os.O_RDWR)
+        try:
+            deadline = time.monotonic() + self.lock_timeout_s
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise JsonStoreError(
+                            f"Could not acquire lock for {self.path} within {self.lock_timeout_s}s"
+                        )
+                    time.sleep(self.lock_poll_interval_s)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def _lock_file_polling(self) -> Iterator[None]:
+        """Legacy O_EXCL poll loop for platforms without fcntl."""
         start = time.monotonic()
         fd: Optional[int] = None
 
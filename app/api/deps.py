@@ -3,7 +3,12 @@ from __future__ import annotations
 from functools import lru_cache
 
 from app.core.config import get_settings
-from app.repositories.file_json import FileBookingRepository, FileCarRepository
+from app.repositories.file_json import (
+    FileBookingRepository,
+    FileCarRepository,
+    SnapshotCache,
+    serialize_rental_data,
+)
 from app.adapters.datasources.json_store import JsonStore
 from app.services.bookings import BookingService
 
@@ -15,7 +20,15 @@ def _json_store() -> JsonStore:
     Single JsonStore instance per process.
     Uses settings for data file location.
     """
-    return JsonStore(path=settings.DATA_FILE_PATH)
+    return JsonStore(path=settings.DATA_FILE_PATH, serializer=serialize_rental_data)
+
+
+@lru_cache(maxsize=1)
+def _snapshot_cache() -> SnapshotCache:
+    """
+    Single parsed-snapshot cache per process, shared by both repositories.
+    """
+    return SnapshotCache(json_store=_json_store())
 
 
 @lru_cache(maxsize=1)
@@ -23,7 +36,7 @@ def _car_repository() -> FileCarRepository:
     """
     Single CarRepository instance per process.
     """
-    return FileCarRepository(json_store=_json_store())
+    return FileCarRepository(json_store=_json_store(), snapshot_cache=_snapshot_cache())
 
 
 @lru_cache(maxsize=1)
@@ -31,12 +44,24 @@ def _booking_repository() -> FileBookingRepository:
     """
     Single BookingRepository instance per process.
     """
-    return FileBookingRepository(json_store=_json_store())
+    return FileBookingRepository(json_store=_json_store(), snapshot_cache=_snapshot_cache())
 
 
+@lru_cache(maxsize=1)
+def get_snapshot_cache() -> SnapshotCache:
+    """
+    SnapshotCache dependency.
+    Exposes the data version stamp for conditional GET handling.
+    """
+    return _snapshot_cache()
+
+
+@lru_cache(maxsize=1)
 def get_booking_service() -> BookingService:
     """
     BookingService dependency.
+    The service is a frozen dataclass over process-wide singletons, so one
+    instance per process is safe and avoids per-request construction.
     """
     return BookingService(
         car_repository=_car_repository(),
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import logging
+from functools import partial
+
+import anyio.to_thread
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.deps import get_booking_service
@@ -18,7 +22,7 @@ router = APIRouter(prefix="/bookings", tags=["bookings"])
 
 
 @router.post("", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
-def create_booking(
+async def create_booking(
     payload: CreateBookingRequest,
     service: BookingService = Depends(get_booking_service),
 ) -> BookingResponse:
@@ -30,27 +34,42 @@ def create_booking(
     - **end_date**: Booking end date (YYYY-MM-DD)  
     - **customer_name**: Name of the customer
     """
-    logger.info(
-        "Booking attempt: car_id=%d, dates=%s to %s, customer=%s",
-        payload.car_id,
-        payload.start_date,
-        payload.end_date,
-        payload.customer_name,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Booking attempt: car_id=%d, dates=%s to %s, customer=%s",
+            payload.car_id,
+            payload.start_date,
+            payload.end_date,
+            payload.customer_name,
+        )
     try:
-        booking = service.create_booking(
-            car_id=payload.car_id,
-            start_date=payload.start_date,
-            end_date=payload.end_date,
-            customer_name=payload.customer_name,
+        # The service does blocking file I/O; run it on the worker thread
+        # pool so the event loop stays free under load.
+        booking = await anyio.to_thread.run_sync(
+            partial(
+                service.create_booking,
+                car_id=payload.car_id,
+                start_date=payload.start_date,
+                end_date=payload.end_date,
+                customer_name=payload.customer_name,
+            )
         )
-        logger.info(
-            "Booking successful: booking_id=%d, car_id=%d, customer=%s",
-            booking.id,
-            booking.car_id,
-            booking.customer_name,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Booking successful: booking_id=%d, car_id=%d, customer=%s",
+                booking.id,
+                booking.car_id,
+                booking.customer_name,
+            )
+        # model_construct skips validation: the fields come straight from the
+        # already-validated Booking model and match the schema one-to-one.
+        return BookingResponse.model_construct(
+            id=booking.id,
+            car_id=booking.car_id,
+            start_date=booking.start_date,
+            end_date=booking.end_date,
+            customer_name=booking.customer_name,
         )
-        return BookingResponse.model_validate(booking.model_dump())
     
     except CarNotFoundError as e:
         logger.warning("Booking failed - car not found: car_id=%d", payload.car_id)
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import date
-from typing import List
+from functools import partial
+from typing import List, Sequence
 
-from fastapi import APIRouter, Depends, Query
+import anyio.to_thread
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from app.api.deps import get_booking_service
+from app.api.deps import get_booking_service, get_snapshot_cache
 from app.core.logging import get_logger
 from app.models.models import Car
+from app.repositories.file_json import SnapshotCache
 from app.services.bookings import BookingService
 
 logger = get_logger(__name__)
@@ -15,15 +19,36 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/cars", tags=["cars"])
 
 
+def _availability_etag(snapshot_cache: SnapshotCache, target_date: date) -> str:
+    """ETag for an availability query: data version stamp + target date."""
+    key = f"{snapshot_cache.version()}:{target_date.isoformat()}"
+    return '"%s"' % hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
 @router.get("/available", response_model=List[Car])
-def get_available_cars(
+async def get_available_cars(
+    request: Request,
+    response: Response,
     date: date = Query(..., description="Target date (YYYY-MM-DD) to check car availability."),
     service: BookingService = Depends(get_booking_service),
-) -> List[Car]:
+    snapshot_cache: SnapshotCache = Depends(get_snapshot_cache),
+) -> Sequence[Car]:
     """
     Retrieve a list of cars available for booking on a specific date.
+
+    Emits an ETag derived from the data files' change stamp so clients can
+    revalidate with If-None-Match and receive a bodyless 304 when nothing
+    changed.
     """
+    etag = _availability_etag(snapshot_cache, date)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     logger.info("Querying available cars for date: %s", date)
-    available_cars = service.available_cars(target_date=date)
+    # Snapshot rebuilds hit the disk; keep that off the event loop.
+    available_cars = await anyio.to_thread.run_sync(
+        partial(service.available_cars, target_date=date)
+    )
     logger.info("Found %d available cars for date %s", len(available_cars), date)
-    return list(available_cars)
\ No newline at end of file
+    return available_cars
\ No newline at end of file
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from datetime import date
 from pydantic import BaseModel, Field, model_validator
-from typing import Self
+from typing import Any
+
+__all__ = ["BookingResponse", "CreateBookingRequest"]
 
 
 class CreateBookingRequest(BaseModel):
@@ -11,11 +13,23 @@ class CreateBookingRequest(BaseModel):
     end_date: date = Field(..., description="Booking end date")
     customer_name: str = Field(..., min_length=1, max_length=100, description="Name of the customer")
 
-    @model_validator(mode="after")
-    def validate_date_range(self) -> Self:
-        if self.end_date < self.start_date:
-            raise ValueError("end_date must be on or after start_date")
-        return self
+    @model_validator(mode="before")
+    @classmethod
+    def validate_date_range(cls, values: Any) -> Any:
+        # Check the raw input before the model is built: ISO date strings
+        # compare chronologically, so no coercion or second model pass is
+        # needed. Inputs this check cannot compare are left to field
+        # validation (and the service enforces the same invariant).
+        if isinstance(values, dict):
+            start = values.get("start_date")
+            end = values.get("end_date")
+            if (
+                isinstance(start, (str, date))
+                and type(start) is type(end)
+                and end < start
+            ):
+                raise ValueError("end_date must be on or after start_date")
+        return values
 
 
 class BookingResponse(BaseModel):
@@ -23,5 +23,6 @@ def setup_logging() -> None:
 
 
 def get_logger(name: str) -> logging.Logger:
-    setup_logging()
+    # Handler configuration happens once in the application lifespan;
+    # repeating the hasHandlers() walk here on every call buys nothing.
     return logging.getLogger(name)
\ No newline at end of file
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -12,31 +12,54 @@ from starlette.responses import JSONResponse
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Simple in-memory rate limiter.
-    Limits requests per IP address using a sliding window.
+    Limits requests per IP address using a sliding window of timestamps
+    kept in a deque, so eviction is amortized O(1) per request instead of
+    rebuilding a list.
     """
-    
+
+    # How often (seconds) to sweep out IPs with no recent requests.
+    _SWEEP_INTERVAL = 60.0
+
     def __init__(self, app, requests_per_minute: int = 60):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.requests: dict[str, list[float]] = defaultdict(list)
-    
+        self.requests: dict[str, deque[float]] = defaultdict(deque)
+        self._next_sweep = time.time() + self._SWEEP_INTERVAL
+
     async def dispatch(self, request: Request, call_next) -> Response:
         # Skip rate limiting for docs/health
         if request.url.path in {"/api/health", "/docs", "/redoc", "/openapi.json"}:
             return await call_next(request)
-        
+
         client_ip = request.client.host if request.client else "unknown"
         now = time.time()
         window_start = now - 60
-        
-        # Clean old requests and add current
-        self.requests[client_ip] = [t for t in self.requests[client_ip] if t > window_start]
-        
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
+
+        # Evict expired timestamps in place
+        window = self.requests[client_ip]
+        while window and window[0] <= window_start:
+            window.popleft()
+
+        if len(window) >= self.requests_per_minute:
             return JSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests. Please try again later."},
             )
-        
-        self.requests[client_ip].append(now)
+
+        window.append(now)
+
+        if now >= self._next_sweep:
+            self._sweep(window_start)
+            self._next_sweep = now + self._SWEEP_INTERVAL
+
         return await call_next(request)
+
+    def _sweep(self, window_start: float) -> None:
+        """Drop IPs whose entire window has expired, bounding memory."""
+        stale = [
+            ip
+            for ip, window in self.requests.items()
+            if not window or window[-1] <= window_start
+        ]
+        for ip in stale:
+            del self.requests[ip]
@@ -1,79 +1,301 @@
 from __future__ import annotations
 
+import json
+import os
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional, Sequence
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from pydantic import TypeAdapter
+
+from app.adapters.datasources.append_log import AppendLog
 from app.adapters.datasources.json_store import JsonStore
 from app.models import Booking, Car
+from app.repositories.interfaces import BookingOverlapError
+
+# Batch adapters validate whole row lists in one pydantic-core call instead
+# of a Python-level model_validate per row.
+_CARS_ADAPTER: TypeAdapter[List[Car]] = TypeAdapter(List[Car])
+_BOOKINGS_ADAPTER: TypeAdapter[List[Booking]] = TypeAdapter(List[Booking])
+
+# Fold the append-only booking log back into the data file once it grows
+# past this many records.
+_COMPACTION_THRESHOLD = 256
+
+
+def _booking_log_path(json_store: JsonStore):
+    return json_store.path.with_name(f"{json_store.path.stem}.bookings.log")
+
+
+def _dump_car(car: Dict[str, Any]) -> str:
+    return '{"id":%d,"make":%s,"model":%s}' % (
+        car["id"],
+        json.dumps(car["make"], ensure_ascii=False),
+        json.dumps(car["model"], ensure_ascii=False),
+    )
+
+
+def _dump_booking(booking: Dict[str, Any]) -> str:
+    return '{"car_id":%d,"customer_name":%s,"end_date":%s,"id":%d,"start_date":%s}' % (
+        booking["car_id"],
+        json.dumps(booking["customer_name"], ensure_ascii=False),
+        json.dumps(booking["end_date"]),
+        booking["id"],
+        json.dumps(booking["start_date"]),
+    )
+
+
+def serialize_rental_data(data: Dict[str, Any]) -> str:
+    """
+    Schema-specialized JSON writer for the {cars, bookings} data file.
+
+    Emits the output in a single pass with no dict traversal or key
+    sorting; falls back to the generic serializer if the data has drifted
+    from the expected shape.
+    """
+    try:
+        if set(data) <= {"cars", "bookings"}:
+            return '{"bookings":[%s],"cars":[%s]}' % (
+                ",".join(map(_dump_booking, data.get("bookings", ()))),
+                ",".join(map(_dump_car, data.get("cars", ()))),
+            )
+    except (KeyError, TypeError, ValueError):
+        pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """
+    Immutable parsed view of the data file at a given (mtime_ns, size).
+
+    Besides the raw model lists, the snapshot carries lookup indexes built
+    once per rebuild:
+      - cars_by_id: O(1) car lookup
+      - bookings_by_car: per-car booking lists, sorted by start_date
+      - bookings_sorted_by_start: bookings ordered by start_date
+      - start_ordinals / end_ordinals: the sorted bookings' dates as
+        toordinal() ints in compact arrays, so date scans are integer
+        comparisons over contiguous memory instead of date-object hops
+      - max_end_prefix: running maximum of end ordinal over the sorted
+        bookings, used to prune date-range scans early
+    """
+
+    key: Tuple[int, int, int, int]
+    cars: List[Car]
+    bookings: List[Booking]
+    cars_by_id: Dict[int, Car]
+    bookings_by_car: Dict[int, List[Booking]]
+    bookings_sorted_by_start: List[Booking]
+    start_ordinals: array
+    end_ordinals: array
+    max_end_prefix: array
+
+
+class SnapshotCache:
+    """
+    In-memory cache of the parsed data file plus the booking append log.
+
+    The cache is keyed by (st_mtime_ns, st_size) of both the data file and
+    the log, so parsed models are rebuilt only when something actually
+    changed on disk. Share one instance between repositories backed by the
+    same JsonStore so a single parse serves both.
+    """
+
+    def __init__(self, json_store: JsonStore) -> None:
+        self._json_store = json_store
+        self.booking_log = AppendLog(path=_booking_log_path(json_store))
+        self._mutex = Lock()
+        self._snapshot: Optional[_Snapshot] = None
+
+    def get(self) -> _Snapshot:
+        """Return the current snapshot, rebuilding it if the files changed."""
+        key = self._stat()
+        with self._mutex:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.key == key:
+                return snapshot
+            snapshot = self._build(key)
+            self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next get() re-reads the files."""
+        with self._mutex:
+            self._snapshot = None
+
+    def version(self) -> Tuple[int, int, int, int]:
+        """
+        Change stamp of the underlying files (stat of data file + log).
+        Stable while nothing changes on disk; usable as a cache key.
+        """
+        return self._stat()
+
+    # -------- Private Helpers --------
+    def _stat(self) -> Tuple[int, int, int, int]:
+        return self._stat_one(self._json_store.path) + self._stat_one(
+            self.booking_log.path
+        )
+
+    @staticmethod
+    def _stat_one(path) -> Tuple[int, int]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return (-1, -1)
+        return st.st_mtime_ns, st.st_size
+
+    def _build(self, key: Tuple[int, int, int, int]) -> _Snapshot:
+        # snapshot() shares one parsed raw dict across every consumer of the
+        # store; this layer only reads from it.
+        data = self._json_store.snapshot()
+        cars = _CARS_ADAPTER.validate_python(data.get("cars", []))
+        bookings = _BOOKINGS_ADAPTER.validate_python(
+            data.get("bookings", []) + self.booking_log.read_all()
+        )
+
+        cars_by_id = {car.id: car for car in cars}
+
+        bookings_by_car: Dict[int, List[Booking]] = {}
+        for booking in bookings:
+            bookings_by_car.setdefault(booking.car_id, []).append(booking)
+        for car_bookings in bookings_by_car.values():
+            car_bookings.sort(key=lambda b: b.start_date)
+
+        bookings_sorted_by_start = sorted(bookings, key=lambda b: b.start_date)
+        start_ordinals = array(
+            "l", (b.start_date.toordinal() for b in bookings_sorted_by_start)
+        )
+        end_ordinals = array(
+            "l", (b.end_date.toordinal() for b in bookings_sorted_by_start)
+        )
+
+        max_end_prefix = array("l")
+        running_max = -1
+        for end_ordinal in end_ordinals:
+            if end_ordinal > running_max:
+                running_max = end_ordinal
+            max_end_prefix.append(running_max)
+
+        return _Snapshot(
+            key=key,
+            cars=cars,
+            bookings=bookings,
+            cars_by_id=cars_by_id,
+            bookings_by_car=bookings_by_car,
+            bookings_sorted_by_start=bookings_sorted_by_start,
+            start_ordinals=start_ordinals,
+            end_ordinals=end_ordinals,
+            max_end_prefix=max_end_prefix,
+        )
+
 
 class FileCarRepository:
     """
     JSON-backed repository for Cars.
     """
-    def __init__(self, json_store: JsonStore):
+    def __init__(self, json_store: JsonStore, snapshot_cache: Optional[SnapshotCache] = None):
         self._json_store = json_store
-    
+        self._snapshot_cache = snapshot_cache or SnapshotCache(json_store)
+
 
     def list_all(self) -> Sequence[Car]:
-        cars_data = self._json_store.read()
-        cars_raw = cars_data.get("cars", [])
-        return [Car.model_validate(car) for car in cars_raw]
+        return self._snapshot_cache.get().cars
 
 
     def get_by_id(self, car_id: int) -> Optional[Car]:
-        data = self._json_store.read()
-        for car in data.get("cars", []):
-            if car["id"] == car_id:
-                return Car.model_validate(car)
-        return None
+        return self._snapshot_cache.get().cars_by_id.get(car_id)
 
 
 class FileBookingRepository:
     """
     JSON-backed repository for Bookings.
     """
-    def __init__(self, json_store: JsonStore):
+    def __init__(self, json_store: JsonStore, snapshot_cache: Optional[SnapshotCache] = None):
         self._json_store = json_store
-    
+        self._snapshot_cache = snapshot_cache or SnapshotCache(json_store)
+
 
     def list_all(self) -> Sequence[Booking]:
-        bookings_data = self._json_store.read()
-        bookings_raw = bookings_data.get("bookings", [])
-        return [Booking.model_validate(booking) for booking in bookings_raw]
-    
+        return self._snapshot_cache.get().bookings
+
     def list_by_car_id(self, car_id: int) -> Sequence[Booking]:
-        bookings_data = self._json_store.read()
-        bookings_raw = bookings_data.get("bookings", [])
-        return [
-            Booking.model_validate(booking)
-            for booking in bookings_raw
-            if booking["car_id"] == car_id
-        ]
+        return self._snapshot_cache.get().bookings_by_car.get(car_id, [])
 
     def list_by_date(self, target_date: date) -> Sequence[Booking]:
-        bookings_data = self._json_store.read()
-        target_date_str = target_date.isoformat()
-        bookings: List[Booking] = []
-
-        for booking in bookings_data.get("bookings", []):
-            if booking["start_date"] <= target_date_str <= booking["end_date"]:
-                bookings.append(Booking.model_validate(booking))
-        return bookings
+        snapshot = self._snapshot_cache.get()
+        # Only bookings starting on or before the target can cover it; walk
+        # the sorted prefix backwards over the ordinal arrays (pure int
+        # compares) and stop once even the best end date seen so far falls
+        # short of the target.
+        target = target_date.toordinal()
+        hi = bisect_right(snapshot.start_ordinals, target)
+        matches: List[Booking] = []
+        for i in range(hi - 1, -1, -1):
+            if snapshot.max_end_prefix[i] < target:
+                break
+            if snapshot.end_ordinals[i] >= target:
+                matches.append(snapshot.bookings_sorted_by_start[i])
+        matches.reverse()
+        return matches
 
     def add(self, booking: Booking) -> Booking:
-        """Add a booking with atomic ID generation."""
-        new_booking_holder: list[Booking] = []
-        
-        def _append_booking(data: dict) -> dict:
-            bookings = data.setdefault("bookings", [])
+        """
+        Add a booking by appending to the JSONL booking log.
+
+        Each insert writes O(1) bytes (one fsync'd log line) instead of
+        rewriting the whole data file. The overlap check and ID generation
+        run against the authoritative base file plus log inside the store's
+        lock window, so a conflicting booking persisted between the caller's
+        check and this write is still rejected. Once the log grows past
+        _COMPACTION_THRESHOLD it is folded back into the data file via the
+        store's atomic-rename write, still under the same lock.
+
+        Raises BookingOverlapError on a conflicting booking.
+        """
+        start_str = booking.start_date.isoformat()
+        end_str = booking.end_date.isoformat()
+        log = self._snapshot_cache.booking_log
+
+        with self._json_store.locked():
+            data = self._json_store.read_unlocked()
+            log_records = log.read_all()
+            existing = data.get("bookings", []) + log_records
+
+            # Re-check for overlaps inside the lock (ISO strings compare
+            # chronologically), closing the check-then-write race.
+            for record in existing:
+                if (
+                    record["car_id"] == booking.car_id
+                    and record["start_date"] <= end_str
+                    and start_str <= record["end_date"]
+                ):
+                    raise BookingOverlapError(
+                        booking.car_id, booking.start_date, booking.end_date
+                    )
+
             # Atomic ID generation inside the lock
-            max_id = max((b["id"] for b in bookings), default=0)
-            new_id = max_id + 1
-            booking_with_id = booking.model_copy(update={"id": new_id})
-            bookings.append(booking_with_id.model_dump(mode="json"))
-            new_booking_holder.append(booking_with_id)
-            return data
-        
-        self._json_store.update(_append_booking)
-        return new_booking_holder[0]
-        
\ No newline at end of file
+            max_id = max((b["id"] for b in existing), default=0)
+            booking_with_id = booking.model_copy(update={"id": max_id + 1})
+            # Build the JSON-mode record directly; the fields are already
+            # validated, so a full model_dump pass adds nothing.
+            record = {
+                "id": booking_with_id.id,
+                "car_id": booking.car_id,
+                "start_date": start_str,
+                "end_date": end_str,
+                "customer_name": booking.customer_name,
+            }
+            log.append(record)
+            log_records.append(record)
+
+            if len(log_records) >= _COMPACTION_THRESHOLD:
+                data.setdefault("bookings", []).extend(log_records)
+                self._json_store.write_unlocked(data)
+                log.clear()
+
+        self._snapshot_cache.invalidate()
+        return booking_with_id
@@ -6,6 +6,21 @@ from typing import Optional, Protocol, Sequence, runtime_checkable
 from app.models import Booking, Car
 
 
+class BookingOverlapError(Exception):
+    """
+    Raised by BookingRepository.add when the booking overlaps an existing
+    booking for the same car at persist time.
+    """
+    def __init__(self, car_id: int, start_date: date, end_date: date) -> None:
+        super().__init__(
+            f"Booking for car ID {car_id} overlaps an existing booking "
+            f"between {start_date} and {end_date}."
+        )
+        self.car_id = car_id
+        self.start_date = start_date
+        self.end_date = end_date
+
+
 @runtime_checkable
 class CarRepository(Protocol):
     """
@@ -22,6 +37,13 @@ class BookingRepository(Protocol):
     Abstraction over booking persistence.
     """
     def list_all(self) -> Sequence[Booking]: ...
-    def list_by_car_id(self, car_id: int) -> Sequence[Booking]: ...
+
+    def list_by_car_id(self, car_id: int) -> Sequence[Booking]:
+        """Bookings for a car, ordered by start_date ascending."""
+        ...
+
     def list_by_date(self, target_date: date) -> Sequence[Booking]: ...
-    def add(self, booking: Booking) -> Booking: ...
\ No newline at end of file
+
+    def add(self, booking: Booking) -> Booking:
+        """May raise BookingOverlapError if the booking conflicts at persist time."""
+        ...
\ No newline at end of file
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date
+from operator import attrgetter
 from typing import Sequence
 
 from app.models.models import Booking, Car
-from app.repositories.interfaces import BookingRepository, CarRepository
+from app.repositories.interfaces import (
+    BookingOverlapError,
+    BookingRepository,
+    CarRepository,
+)
 
 
 class BookingServiceError(Exception):
@@ -68,14 +74,22 @@ class BookingService:
             end_date=end_date,
             customer_name=customer_name
         )
-        return self.booking_repository.add(new_booking)
+        try:
+            return self.booking_repository.add(new_booking)
+        except BookingOverlapError as e:
+            # A competing booking landed between our conflict check and the
+            # repository's locked write; surface it as a regular conflict.
+            raise BookingConflictError(car_id, start_date, end_date) from e
     
 
     # -------- Private Helpers --------
     def _has_booking_conflict(self, *, car_id: int, start_date: date, end_date: date) -> bool:
         existing_bookings = self.booking_repository.list_by_car_id(car_id)
-        for booking in existing_bookings:
-            if self._overlaps(booking.start_date, booking.end_date, start_date, end_date):
+        # list_by_car_id returns bookings sorted by start_date: anything
+        # starting after end_date cannot overlap, so bisect caps the scan.
+        hi = bisect_right(existing_bookings, end_date, key=attrgetter("start_date"))
+        for booking in existing_bookings[:hi]:
+            if booking.end_date >= start_date:
                 return True
         return False
     
@@ -0,0 +1,71 @@
+"""
+Shared fixtures for the test suite.
+"""
+from __future__ import annotations
+
+import pytest
+
+
+class _Recorder:
+    """
+    Minimal callable stand-in for a MagicMock method: records calls and
+    plays back return_value / side_effect, without mock's spec
+    introspection or attribute-invention overhead.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def reset(self):
+        self.return_value = None
+        self.side_effect = None
+        self.calls.clear()
+
+    def assert_called_once(self):
+        assert len(self.calls) == 1, f"expected exactly one call, got {self.calls}"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)], (
+            f"expected one call with {(args, kwargs)}, got {self.calls}"
+        )
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, built once per session."""
+    # Imported lazily so collection-only runs skip the app import chain.
+    from app.main import create_app
+
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def base_client(app):
+    """
+    Session-wide TestClient over the shared app.
+
+    Instantiated without the context manager: entering it only runs the
+    app lifespan (logging setup), which the tests don't rely on, so we
+    skip the startup/shutdown portal handshake.
+
+    A bare httpx.Client over httpx.ASGITransport would shave off the
+    remaining sync/async bridging, but that transport is async-only;
+    TestClient is exactly the sync bridge for it, so this single
+    persistent instance is as lean as a sync suite gets.
+    """
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    # Warm each route once (responses discarded, both 422) so path-regex
+    # compilation and routing caches are hot before the first test runs.
+    client.get("/api/cars/available")
+    client.post("/api/bookings", json={})
+    return client
@@ -3,36 +3,73 @@ Tests for the Car Rental API endpoints.
 """
 from __future__ import annotations
 
+import copy
+import json
+
 import pytest
 from datetime import date
-from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
 
-from app.main import create_app
 from app.api.deps import get_booking_service
-from app.services.bookings import BookingService
 from app.models.models import Car, Booking
+from app.services.bookings import (
+    BookingConflictError,
+    BookingServiceError,
+    CarNotFoundError,
+)
+from tests.conftest import _Recorder
+
+# Immutable sample data, built once instead of per test.
+CAR_TOYOTA = Car(id=1, make="Toyota", model="Corolla")
+CAR_HONDA = Car(id=2, make="Honda", model="Civic")
+BOOKING_JAN25 = Booking(
+    id=1,
+    car_id=1,
+    start_date=date(2026, 1, 25),
+    end_date=date(2026, 1, 27),
+    customer_name="John Doe",
+)
+
+# Static request payload, encoded once instead of per post().
+_JSON_HEADERS = {"content-type": "application/json"}
+_PAYLOAD_VALID = json.dumps(
+    {
+        "car_id": 1,
+        "start_date": "2026-01-25",
+        "end_date": "2026-01-27",
+        "customer_name": "John Doe",
+    }
+).encode()
+
+
+class FakeBookingService:
+    """Hand-written fake covering the service surface the routes use."""
+
+    def __init__(self):
+        self.available_cars = _Recorder()
+        self.create_booking = _Recorder()
+
+
+@pytest.fixture(scope="session")
+def _fake_service_template():
+    """One FakeBookingService instance to copy from, built once."""
+    return FakeBookingService()
 
 
 @pytest.fixture
-def mock_booking_service():
-    """Create a mock booking service for testing."""
-    service = MagicMock(spec=BookingService)
+def mock_booking_service(_fake_service_template):
+    """Per-test fake service: shallow-copy the template, fresh recorders."""
+    service = copy.copy(_fake_service_template)
+    service.available_cars = _Recorder()
+    service.create_booking = _Recorder()
     return service
 
 
 @pytest.fixture
-def client(mock_booking_service):
-    """Create a test client with mocked dependencies."""
-    app = create_app()
-    
-    def override_booking_service():
-        return mock_booking_service
-    
-    app.dependency_overrides[get_booking_service] = override_booking_service
-    
-    with TestClient(app) as test_client:
-        yield test_client
+def client(app, base_client, mock_booking_service):
+    """Session client with the booking service override rotated per test."""
+    app.dependency_overrides[get_booking_service] = lambda: mock_booking_service
+    yield base_client
+    app.dependency_overrides.pop(get_booking_service, None)
 
 
 class TestGetAvailableCars:
@@ -42,11 +79,7 @@ class TestGetAvailableCars:
         """Should return a list of available cars for a given date."""
         # Arrange
         target_date = date(2026, 1, 25)
-        mock_cars = [
-            Car(id=1, make="Toyota", model="Corolla"),
-            Car(id=2, make="Honda", model="Civic"),
-        ]
-        mock_booking_service.available_cars.return_value = mock_cars
+        mock_booking_service.available_cars.return_value = [CAR_TOYOTA, CAR_HONDA]
         
         # Act
         response = client.get(f"/api/cars/available?date={target_date.isoformat()}")
@@ -72,22 +105,6 @@ class TestGetAvailableCars:
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_get_available_cars_requires_date(self, client):
-        """Should return 422 when date parameter is missing."""
-        # Act
-        response = client.get("/api/cars/available")
-        
-        # Assert
-        assert response.status_code == 422
-
-    def test_get_available_cars_invalid_date_format(self, client):
-        """Should return 422 for invalid date format."""
-        # Act
-        response = client.get("/api/cars/available?date=invalid-date")
-        
-        # Assert
-        assert response.status_code == 422
-
 
 class TestCreateBooking:
     """Tests for POST /api/bookings endpoint."""
@@ -95,24 +112,12 @@ class TestCreateBooking:
     def test_create_booking_success(self, client, mock_booking_service):
         """Should create a booking successfully."""
         # Arrange
-        mock_booking = Booking(
-            id=1,
-            car_id=1,
-            start_date=date(2026, 1, 25),
-            end_date=date(2026, 1, 27),
-            customer_name="John Doe",
-        )
-        mock_booking_service.create_booking.return_value = mock_booking
-        
-        payload = {
-            "car_id": 1,
-            "start_date": "2026-01-25",
-            "end_date": "2026-01-27",
-            "customer_name": "John Doe",
-        }
-        
+        mock_booking_service.create_booking.return_value = BOOKING_JAN25
+
         # Act
-        response = client.post("/api/bookings", json=payload)
+        response = client.post(
+            "/api/bookings", content=_PAYLOAD_VALID, headers=_JSON_HEADERS
+        )
         
         # Assert
         assert response.status_code == 201
@@ -121,87 +126,113 @@ class TestCreateBooking:
         assert data["car_id"] == 1
         assert data["customer_name"] == "John Doe"
 
-    def test_create_booking_car_not_found(self, client, mock_booking_service):
-        """Should return 404 when car does not exist."""
-        from app.services.bookings import CarNotFoundError
-        
+    @pytest.mark.parametrize(
+        "side_effect,payload,expected_status,detail_substr",
+        [
+            # Car missing -> 404
+            (
+                CarNotFoundError(car_id=999),
+                {
+                    "car_id": 999,
+                    "start_date": "2026-01-25",
+                    "end_date": "2026-01-27",
+                    "customer_name": "John Doe",
+                },
+                404,
+                "not found",
+            ),
+            # Overlapping booking -> 409
+            (
+                BookingConflictError(
+                    car_id=1,
+                    start_date=date(2026, 1, 25),
+                    end_date=date(2026, 1, 27),
+                ),
+                {
+                    "car_id": 1,
+                    "start_date": "2026-01-25",
+                    "end_date": "2026-01-27",
+                    "customer_name": "John Doe",
+                },
+                409,
+                "conflict",
+            ),
+            # Generic service error -> 422
+            (
+                BookingServiceError("End date cannot be before start date."),
+                {
+                    "car_id": 1,
+                    "start_date": "2026-01-25",
+                    "end_date": "2026-01-27",
+                    "customer_name": "John Doe",
+                },
+                422,
+                "end date",
+            ),
+            # end_date before start_date is rejected at the schema level
+            (
+                None,
+                {
+                    "car_id": 1,
+                    "start_date": "2026-01-27",
+                    "end_date": "2026-01-25",
+                    "customer_name": "John Doe",
+                },
+                422,
+                None,
+            ),
+        ],
+    )
+    def test_create_booking_error_paths(
+        self,
+        client,
+        mock_booking_service,
+        side_effect,
+        payload,
+        expected_status,
+        detail_substr,
+    ):
+        """Should map service failures and invalid input to error statuses."""
         # Arrange
-        mock_booking_service.create_booking.side_effect = CarNotFoundError(car_id=999)
-        
-        payload = {
-            "car_id": 999,
-            "start_date": "2026-01-25",
-            "end_date": "2026-01-27",
-            "customer_name": "John Doe",
-        }
-        
-        # Act
-        response = client.post("/api/bookings", json=payload)
-        
-        # Assert
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        mock_booking_service.create_booking.side_effect = side_effect
 
-    def test_create_booking_conflict(self, client, mock_booking_service):
-        """Should return 409 when booking conflicts with existing booking."""
-        from app.services.bookings import BookingConflictError
-        
-        # Arrange
-        mock_booking_service.create_booking.side_effect = BookingConflictError(
-            car_id=1,
-            start_date=date(2026, 1, 25),
-            end_date=date(2026, 1, 27),
-        )
-        
-        payload = {
-            "car_id": 1,
-            "start_date": "2026-01-25",
-            "end_date": "2026-01-27",
-            "customer_name": "John Doe",
-        }
-        
         # Act
         response = client.post("/api/bookings", json=payload)
-        
-        # Assert
-        assert response.status_code == 409
-        assert "conflict" in response.json()["detail"].lower()
-
-    def test_create_booking_invalid_dates(self, client, mock_booking_service):
-        """Should return 422 when end_date is before start_date."""
-        # Note: With schema validation, this is now caught at the schema level
-        payload = {
-            "car_id": 1,
-            "start_date": "2026-01-27",
-            "end_date": "2026-01-25",
-            "customer_name": "John Doe",
-        }
-        
-        # Act
-        response = client.post("/api/bookings", json=payload)
-        
-        # Assert
-        assert response.status_code == 422
 
-    def test_create_booking_missing_fields(self, client):
-        """Should return 422 when required fields are missing."""
-        # Act
-        response = client.post("/api/bookings", json={})
-        
-        # Assert
-        assert response.status_code == 422
-
-    def test_create_booking_empty_customer_name(self, client):
-        """Should return 422 when customer_name is empty."""
-        payload = {
-            "car_id": 1,
-            "start_date": "2026-01-25",
-            "end_date": "2026-01-27",
-            "customer_name": "",
-        }
-        
-        # Act
-        response = client.post("/api/bookings", json=payload)
-        
         # Assert
+        assert response.status_code == expected_status
+        if detail_substr is not None:
+            assert detail_substr in response.json()["detail"].lower()
+
+
+class TestRequestValidation:
+    """Pure FastAPI validation failures - no service interaction needed."""
+
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            # Missing date query parameter
+            ("GET", "/api/cars/available", {}),
+            # Malformed date query parameter
+            ("GET", "/api/cars/available", {"params": {"date": "invalid-date"}}),
+            # Missing required body fields
+            ("POST", "/api/bookings", {"json": {}}),
+            # Empty customer_name
+            (
+                "POST",
+                "/api/bookings",
+                {
+                    "json": {
+                        "car_id": 1,
+                        "start_date": "2026-01-25",
+                        "end_date": "2026-01-27",
+                        "customer_name": "",
+                    }
+                },
+            ),
+        ],
+    )
+    def test_validation_422(self, base_client, method, path, kwargs):
+        """Should return 422 for malformed input."""
+        response = getattr(base_client, method.lower())(path, **kwargs)
         assert response.status_code == 422
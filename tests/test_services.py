@@ -5,9 +5,10 @@ from __future__ import annotations
 
 import pytest
 from datetime import date
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from app.models.models import Booking, Car
+from tests.conftest import _Recorder
 from app.services.bookings import (
     BookingService,
     BookingConflictError,
@@ -15,28 +16,66 @@ from app.services.bookings import (
     CarNotFoundError,
 )
 
+# Immutable sample data, built once instead of per test.
+CAR_TOYOTA = Car(id=1, make="Toyota", model="Corolla")
+CAR_HONDA = Car(id=2, make="Honda", model="Civic")
+BOOKING_JOHN_JAN24_26 = Booking(
+    id=1,
+    car_id=1,
+    start_date=date(2026, 1, 24),
+    end_date=date(2026, 1, 26),
+    customer_name="John",
+)
+BOOKING_JOHN_DOE_JAN25_27 = Booking(
+    id=1,
+    car_id=1,
+    start_date=date(2026, 1, 25),
+    end_date=date(2026, 1, 27),
+    customer_name="John Doe",
+)
+BOOKING_EXISTING_JAN24_26 = Booking(
+    id=1,
+    car_id=1,
+    start_date=date(2026, 1, 24),
+    end_date=date(2026, 1, 26),
+    customer_name="Existing Customer",
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="class")
 def mock_car_repository():
-    """Create a mock car repository."""
-    return MagicMock()
+    """Create a fake car repository."""
+    return SimpleNamespace(list_all=_Recorder(), get_by_id=_Recorder())
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_booking_repository():
-    """Create a mock booking repository."""
-    return MagicMock()
+    """Create a fake booking repository."""
+    return SimpleNamespace(
+        list_all=_Recorder(),
+        list_by_car_id=_Recorder(),
+        list_by_date=_Recorder(),
+        add=_Recorder(),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def booking_service(mock_car_repository, mock_booking_repository):
-    """Create a booking service with mocked repositories."""
+    """Create a booking service with mocked repositories, once per class."""
     return BookingService(
         car_repository=mock_car_repository,
         booking_repository=mock_booking_repository,
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_recorders(mock_car_repository, mock_booking_repository):
+    """Clear recorder state between tests sharing the class-scoped fakes."""
+    for fake in (mock_car_repository, mock_booking_repository):
+        for recorder in vars(fake).values():
+            recorder.reset()
+
+
 class TestAvailableCars:
     """Tests for the available_cars method."""
 
@@ -45,10 +84,7 @@ class TestAvailableCars:
     ):
         """Should return all cars when there are no bookings."""
         # Arrange
-        cars = [
-            Car(id=1, make="Toyota", model="Corolla"),
-            Car(id=2, make="Honda", model="Civic"),
-        ]
+        cars = [CAR_TOYOTA, CAR_HONDA]
         mock_car_repository.list_all.return_value = cars
         mock_booking_repository.list_by_date.return_value = []
         
@@ -65,21 +101,8 @@ class TestAvailableCars:
     ):
         """Should exclude cars that are booked on the target date."""
         # Arrange
-        cars = [
-            Car(id=1, make="Toyota", model="Corolla"),
-            Car(id=2, make="Honda", model="Civic"),
-        ]
-        bookings = [
-            Booking(
-                id=1,
-                car_id=1,
-                start_date=date(2026, 1, 24),
-                end_date=date(2026, 1, 26),
-                customer_name="John",
-            )
-        ]
-        mock_car_repository.list_all.return_value = cars
-        mock_booking_repository.list_by_date.return_value = bookings
+        mock_car_repository.list_all.return_value = [CAR_TOYOTA, CAR_HONDA]
+        mock_booking_repository.list_by_date.return_value = [BOOKING_JOHN_JAN24_26]
         
         # Act
         result = booking_service.available_cars(target_date=date(2026, 1, 25))
@@ -110,18 +133,9 @@ class TestCreateBooking:
     ):
         """Should create a booking when car exists and no conflicts."""
         # Arrange
-        car = Car(id=1, make="Toyota", model="Corolla")
-        mock_car_repository.get_by_id.return_value = car
+        mock_car_repository.get_by_id.return_value = CAR_TOYOTA
         mock_booking_repository.list_by_car_id.return_value = []
-        
-        expected_booking = Booking(
-            id=1,
-            car_id=1,
-            start_date=date(2026, 1, 25),
-            end_date=date(2026, 1, 27),
-            customer_name="John Doe",
-        )
-        mock_booking_repository.add.return_value = expected_booking
+        mock_booking_repository.add.return_value = BOOKING_JOHN_DOE_JAN25_27
         
         # Act
         result = booking_service.create_booking(
@@ -172,16 +186,8 @@ class TestCreateBooking:
     ):
         """Should raise BookingConflictError when dates overlap with existing booking."""
         # Arrange
-        car = Car(id=1, make="Toyota", model="Corolla")
-        existing_booking = Booking(
-            id=1,
-            car_id=1,
-            start_date=date(2026, 1, 24),
-            end_date=date(2026, 1, 26),
-            customer_name="Existing Customer",
-        )
-        mock_car_repository.get_by_id.return_value = car
-        mock_booking_repository.list_by_car_id.return_value = [existing_booking]
+        mock_car_repository.get_by_id.return_value = CAR_TOYOTA
+        mock_booking_repository.list_by_car_id.return_value = [BOOKING_EXISTING_JAN24_26]
         
         # Act & Assert
         with pytest.raises(BookingConflictError) as exc_info:
@@ -195,23 +201,25 @@ class TestCreateBooking:
         assert exc_info.value.car_id == 1
 
 
+# (start1, end1, start2, end2, expected) cases for _overlaps; a plain loop
+# beats parametrize machinery for a pure-function micro-test.
+OVERLAP_CASES = [
+    # Overlapping cases
+    (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 5), date(2026, 1, 15), True),
+    (date(2026, 1, 5), date(2026, 1, 15), date(2026, 1, 1), date(2026, 1, 10), True),
+    (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 1), date(2026, 1, 10), True),
+    (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 3), date(2026, 1, 5), True),
+    # Non-overlapping cases
+    (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 11), date(2026, 1, 20), False),
+    (date(2026, 1, 11), date(2026, 1, 20), date(2026, 1, 1), date(2026, 1, 10), False),
+]
+
+
 class TestOverlaps:
     """Tests for the _overlaps static method."""
 
-    @pytest.mark.parametrize(
-        "start1,end1,start2,end2,expected",
-        [
-            # Overlapping cases
-            (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 5), date(2026, 1, 15), True),
-            (date(2026, 1, 5), date(2026, 1, 15), date(2026, 1, 1), date(2026, 1, 10), True),
-            (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 1), date(2026, 1, 10), True),
-            (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 3), date(2026, 1, 5), True),
-            # Non-overlapping cases
-            (date(2026, 1, 1), date(2026, 1, 10), date(2026, 1, 11), date(2026, 1, 20), False),
-            (date(2026, 1, 11), date(2026, 1, 20), date(2026, 1, 1), date(2026, 1, 10), False),
-        ],
-    )
-    def test_overlaps_detection(self, start1, end1, start2, end2, expected):
+    def test_overlaps_detection(self):
         """Should correctly detect overlapping date ranges."""
-        result = BookingService._overlaps(start1, end1, start2, end2)
-        assert result == expected
+        for start1, end1, start2, end2, expected in OVERLAP_CASES:
+            result = BookingService._overlaps(start1, end1, start2, end2)
+            assert result == expected, (start1, end1, start2, end2)